@@ -1,14 +1,21 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify
 from flask_cors import CORS
 import base64
 import os
 import uuid
 import subprocess
+import time
+import wave
+from contextlib import contextmanager
 
 from llm.gemini_client import GeminiClient
 from stt.whisper_stt import transcribe_audio
-from tts.local_tts import synthesize_speech
+from tts.local_tts import text_to_mp3
 from conversation.interview_manager import InterviewManager
+from conversation.transcript_log import TranscriptLog, bounded_session_id
+from conversation.opening_pool import OpeningPool
+from utils.static_assets import StaticAssets
+from utils.admission import AdmissionController, Overloaded, RateLimited
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -18,23 +25,72 @@ WEB_AR_DIR = BASE_DIR.parent / "web_ar"
 # App Setup
 # ------------------------
 
+# Upload limits for /respond
+MAX_AUDIO_BYTES = 5 * 1024 * 1024
+MAX_AUDIO_SECONDS = 60
+
 app = Flask(__name__, static_folder="web_ar")
+# base64 inflates by 4/3, plus room for the JSON wrapper
+app.config["MAX_CONTENT_LENGTH"] = MAX_AUDIO_BYTES * 4 // 3 + 64 * 1024
 CORS(app)
 
 os.makedirs("audio/input", exist_ok=True)
 os.makedirs("audio/output", exist_ok=True)
 
-interview_manager = InterviewManager(mode="general")
+# Interview mode: general, technical or behavioral (see prompts/)
+interview_manager = InterviewManager(mode=os.getenv("ARAI_INTERVIEW_MODE", "general"))
+transcript_log = TranscriptLog("logs/transcripts")
+
+# Frontend assets are hashed and pre-compressed once, then served from memory.
+# Set ARAI_OPTIMIZE_GLB=1 to also run the model through gltfpack.
+static_assets = StaticAssets(
+    WEB_AR_DIR,
+    optimize_models=os.getenv("ARAI_OPTIMIZE_GLB") == "1",
+    cache_dir=BASE_DIR / "asset_cache"
+)
+
+# At most 4 requests in the pipeline, 8 more waiting, and each stage capped
+# separately so Whisper never runs twice at once and Gemini stays under quota.
+admission = AdmissionController(
+    max_inflight=4,
+    max_queue=8,
+    queue_timeout=5.0,
+    stage_limits={"ffmpeg": 2, "stt": 1, "llm": 2, "tts": 2},
+    session_rate=0.5,
+    session_burst=3,
+    address_rate=2.0,
+    address_burst=10
+)
+
+# Pre-generated opening questions so /start can answer without a Gemini call.
+# Refilled in the background under the same llm/tts caps as live requests.
+opening_pool = OpeningPool(
+    modes=[interview_manager.mode],
+    size=int(os.getenv("ARAI_OPENING_POOL_SIZE", "5")),
+    pool_dir="audio/pool",
+    stage=admission.stage
+)
+
+# Running this file directly with FLASK_DEBUG=1 (the default) uses the debug
+# reloader, whose watcher process must not touch the pool. Everywhere else
+# start() is called, and of several workers only the one that wins the pool's
+# lock file refills and serves it.
+DEBUG = os.getenv("FLASK_DEBUG", "1") == "1"
+if __name__ != "__main__" or not DEBUG or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+    opening_pool.start()
 
 # ------------------------
 # Utils
 # ------------------------
 
-def convert_to_wav(input_path, output_path):
+def convert_to_wav(input_path, output_path, max_seconds=None):
     """Convert any audio format to 16kHz mono WAV for Whisper"""
+    # Decode at most max_seconds (+1 so over-long uploads are still detectable)
+    limit = ["-t", str(max_seconds + 1)] if max_seconds else []
     subprocess.run([
         "ffmpeg", "-y",
         "-i", input_path,
+        *limit,
         "-ac", "1",
         "-ar", "16000",
         output_path
@@ -44,32 +100,92 @@ def encode_audio_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode("utf-8")
 
+def wav_duration(path):
+    with wave.open(path, "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+@contextmanager
+def stage(name, timings):
+    """Run a pipeline stage under its concurrency cap and record how long it took"""
+    with admission.stage(name):
+        start = time.perf_counter()
+        yield
+        timings[f"{name}_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+def client_address():
+    return request.remote_addr or "unknown"
+
+def session_id():
+    """
+    Clients may send X-Session-Id; otherwise fall back to their address.
+    The id names log files and rate-limit buckets, so it is length-bounded.
+    """
+    return bounded_session_id(request.headers.get("X-Session-Id") or client_address())
+
+# ------------------------
+# Error Handlers
+# ------------------------
+
+@app.errorhandler(Overloaded)
+def handle_overloaded(e):
+    response = jsonify({"error": str(e)})
+    response.status_code = 503
+    response.headers["Retry-After"] = str(e.retry_after)
+    return response
+
+@app.errorhandler(RateLimited)
+def handle_rate_limited(e):
+    response = jsonify({"error": str(e)})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(e.retry_after)
+    return response
+
+@app.errorhandler(413)
+def handle_too_large(e):
+    return jsonify({"error": "Audio upload too large"}), 413
+
 # ------------------------
 # Routes
 # ------------------------
 
 @app.route("/")
 def index():
-    return send_from_directory(WEB_AR_DIR, "index.html")
+    return static_assets.serve("index.html")
 
 @app.route("/models/<path:filename>")
 def serve_models(filename):
-    return send_from_directory(WEB_AR_DIR / "models", filename)
+    return static_assets.serve(f"models/{filename}")
+
 @app.route("/marker/<path:filename>")
 def serve_marker(filename):
-    return send_from_directory(WEB_AR_DIR / "marker", filename)
+    return static_assets.serve(f"marker/{filename}")
 
 @app.route("/start", methods=["GET"])
 def start_interview():
-    print("\n🎤 Starting new interview session...")
-
-    question = interview_manager.start_interview()
-    print(f"ARAI: {question}")
-
-    audio_path = f"audio/output/question_{uuid.uuid4().hex}.mp3"
-    synthesize_speech(question, output_path=audio_path)
-
-    audio_base64 = encode_audio_base64(audio_path)
+    sid = session_id()
+    with admission.admit(sid, client_address()):
+        print("\n🎤 Starting new interview session...")
+        timings = {}
+
+        opener = opening_pool.take(interview_manager.mode)
+        if opener:
+            question = interview_manager.start_with(opener["question"])
+            audio_path = None
+            audio_base64 = opener["audio"]
+            print(f"ARAI (pooled): {question}")
+        else:
+            with stage("llm", timings):
+                question = interview_manager.start_interview()
+            print(f"ARAI: {question}")
+
+            audio_path = f"audio/output/question_{uuid.uuid4().hex}.mp3"
+            with stage("tts", timings):
+                text_to_mp3(question, audio_path)
+
+            audio_base64 = encode_audio_base64(audio_path)
+
+        transcript_log.record(sid, "start", mode=interview_manager.mode, question=question,
+                              audio_out=audio_path, pooled=bool(opener), **timings)
 
     return jsonify({
         "question": question,
@@ -86,42 +202,60 @@ def handle_response():
         return jsonify({"error": "No audio provided"}), 400
 
     audio_b64 = data["audio"]
-    audio_bytes = base64.b64decode(audio_b64)
+    if len(audio_b64) * 3 // 4 > MAX_AUDIO_BYTES:
+        return jsonify({"error": "Audio upload too large"}), 413
 
-    raw_path = f"audio/input/user_{uuid.uuid4().hex}.webm"
-    wav_path = f"audio/input/user_{uuid.uuid4().hex}.wav"
+    sid = session_id()
+    with admission.admit(sid, client_address()):
+        timings = {}
+        audio_bytes = base64.b64decode(audio_b64)
 
-    with open(raw_path, "wb") as f:
-        f.write(audio_bytes)
+        raw_path = f"audio/input/user_{uuid.uuid4().hex}.webm"
+        wav_path = f"audio/input/user_{uuid.uuid4().hex}.wav"
 
-    convert_to_wav(raw_path, wav_path)
+        with open(raw_path, "wb") as f:
+            f.write(audio_bytes)
 
-    user_text = transcribe_audio(wav_path)
-    print(f"User: {user_text}")
+        with stage("ffmpeg", timings):
+            convert_to_wav(raw_path, wav_path, max_seconds=MAX_AUDIO_SECONDS)
 
-    if user_text.strip().lower() in ["exit", "quit", "stop", "end"]:
-        goodbye = "Thank you for your time. Have a great day!"
+        if wav_duration(wav_path) > MAX_AUDIO_SECONDS:
+            return jsonify({"error": f"Audio longer than {MAX_AUDIO_SECONDS} seconds"}), 413
 
-        audio_path = f"audio/output/goodbye_{uuid.uuid4().hex}.mp3"
-        synthesize_speech(goodbye, output_path=audio_path)
+        with stage("stt", timings):
+            user_text = transcribe_audio(wav_path)
+        print(f"User: {user_text}")
 
-        return jsonify({
-            "question": goodbye,
-            "audio": encode_audio_base64(audio_path),
-            "ended": True
-        })
+        if user_text.strip().lower() in ["exit", "quit", "stop", "end"]:
+            goodbye = "Thank you for your time. Have a great day!"
 
-    question = interview_manager.next_question(user_text)
-    print(f"ARAI: {question}")
+            audio_path = f"audio/output/goodbye_{uuid.uuid4().hex}.mp3"
+            with stage("tts", timings):
+                text_to_mp3(goodbye, audio_path)
+            transcript_log.record(sid, "end", user=user_text, question=goodbye,
+                                  audio_in=wav_path, audio_out=audio_path, **timings)
 
-    audio_path = f"audio/output/question_{uuid.uuid4().hex}.mp3"
-    synthesize_speech(question, output_path=audio_path)
+            return jsonify({
+                "question": goodbye,
+                "audio": encode_audio_base64(audio_path),
+                "ended": True
+            })
 
-    return jsonify({
-        "question": question,
-        "audio": encode_audio_base64(audio_path),
-        "ended": False
-    })
+        with stage("llm", timings):
+            question = interview_manager.next_question(user_text)
+        print(f"ARAI: {question}")
+
+        audio_path = f"audio/output/question_{uuid.uuid4().hex}.mp3"
+        with stage("tts", timings):
+            text_to_mp3(question, audio_path)
+        transcript_log.record(sid, "turn", user=user_text, question=question,
+                              audio_in=wav_path, audio_out=audio_path, **timings)
+
+        return jsonify({
+            "question": question,
+            "audio": encode_audio_base64(audio_path),
+            "ended": False
+        })
 
 # ------------------------
 # Entry Point
@@ -136,6 +270,9 @@ if __name__ == "__main__":
     print("\n📱 Access from phone (same WiFi):")
     print("   http://<YOUR_IP>:5000")
     print("\n⚠️ Make sure FFmpeg is installed and in PATH")
+    print("=" * 60)
+    print("\n📦 Static assets (bytes per page load):")
+    print(static_assets.report())
     print("=" * 60 + "\n")
 
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    app.run(host="0.0.0.0", port=5000, debug=DEBUG)
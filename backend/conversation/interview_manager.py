@@ -1,56 +1,52 @@
 # backend/conversation/interview_manager.py
 from llm.gemini_client import GeminiClient
-
-GENERAL_START_PROMPT = """
-You are ARAI, a professional virtual interviewer conducting a general interview.
-
-Rules:
-- Start the interview by greeting the candidate and asking the first question.
-- Ask only one question at a time.
-- Keep the tone friendly and professional.
-- Do not provide answers or opinions.
-- Do not mention you are an AI.
-- Do not break character.
-
-Themes:
-- How the candidate is feeling
-- Their thoughts on AI and technology
-- Their interests and perspectives
-
-Begin the interview now.
-"""
-
-FOLLOW_UP_TEMPLATE = """
-You are ARAI, a professional virtual interviewer conducting a general interview.
-
-Rules:
-- Ask only one question.
-- Keep it conversational and friendly.
-- Do not provide feedback, answers, or opinions.
-- Do not mention you are an AI.
-- Do not break character.
-
-Candidate response:
-"{user_text}"
-
-Ask the next appropriate follow-up question.
-"""
+from conversation.prompt_registry import get_registry
 
 class InterviewManager:
     def __init__(self, mode: str = "general"):
+        self.prompts = get_registry().get(mode)
+        self.mode = mode
         self.client = GeminiClient()
         self.history = []
 
+    def _generate_kwargs(self) -> dict:
+        # Only the short per-mode rules are sent on every turn; themes and
+        # opening instructions stay in the start prompt. The rules are far
+        # below Gemini's 1024-token caching minimum, so keeping them small is
+        # what saves input tokens, not provider-side caching.
+        return {"system_instruction": self.prompts.system}
+
     def start_interview(self) -> str:
-        question = self.client.generate(GENERAL_START_PROMPT)
+        question = self.client.generate(self.prompts.start, **self._generate_kwargs())
+        self.history.append(("ARAI", question))
+        return question
+
+    def start_with(self, question: str) -> str:
+        """Open the interview with an already generated question (e.g. from the opening pool)"""
         self.history.append(("ARAI", question))
         return question
 
     def next_question(self, user_text: str) -> str:
         self.history.append(("User", user_text))
 
-        prompt = FOLLOW_UP_TEMPLATE.format(user_text=user_text)
-        question = self.client.generate(prompt)
+        prompt = self.prompts.follow_up(user_text)
+        question = self.client.generate(prompt, **self._generate_kwargs())
 
         self.history.append(("ARAI", question))
         return question
+
+    def start_interview_stream(self):
+        """Like start_interview, but yields the question as it streams in"""
+        yield from self._stream(self.prompts.start)
+
+    def next_question_stream(self, user_text: str):
+        """Like next_question, but yields the question as it streams in"""
+        self.history.append(("User", user_text))
+        yield from self._stream(self.prompts.follow_up(user_text))
+
+    def _stream(self, prompt: str):
+        parts = []
+        for chunk in self.client.generate_stream(prompt, **self._generate_kwargs()):
+            parts.append(chunk)
+            yield chunk
+        self.history.append(("ARAI", "".join(parts).strip()))
@@ -0,0 +1,343 @@
+# backend/conversation/opening_pool.py
+# Pool of pre-generated, pre-synthesized opening questions per interview mode.
+# A background thread keeps each mode topped up so /start can answer from
+# memory; the pool index is persisted so a restart does not start cold.
+# Only one process per pool_dir owns the pool (an exclusive lock file), so
+# multi-worker servers neither multiply Gemini calls nor serve an opener twice.
+import base64
+import contextlib
+import difflib
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from llm.gemini_client import GeminiClient
+from tts.local_tts import text_to_mp3
+from conversation.prompt_registry import get_registry
+
+# Two openers this similar count as the same question
+SIMILARITY_THRESHOLD = 0.85
+
+# Sample openers a little hotter than live turns so they differ
+OPENING_TEMPERATURE = 1.2
+
+# After this many repeats in a row, stop calling Gemini until the next take()
+MAX_CONSECUTIVE_DISCARDS = 5
+DISCARD_PAUSE_SECONDS = 1800
+
+# How many earlier openers to list in the "do not repeat" instruction
+AVOID_LIST_SIZE = 10
+
+
+def _null_stage(name):
+    return contextlib.nullcontext()
+
+
+def _try_lock(path):
+    """Take an exclusive, non-blocking lock on `path`. Returns the open file or None."""
+    handle = open(path, "a+")
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+class OpeningPool:
+    def __init__(self, modes, size: int = 5, pool_dir: str = "audio/pool",
+                 max_age_seconds: float = 24 * 3600, refill_delay: float = 4.0,
+                 recent_size: int = 20, stage=_null_stage):
+        """
+        Parameters:
+        modes: interview modes to keep a pool for
+        size: target number of ready openers per mode
+        max_age_seconds: openers older than this are discarded (freshness)
+        refill_delay: pause between generations, keeps Gemini under quota
+        recent_size: how many served openers to remember for the variety check
+        stage: context manager factory used to share the llm/tts concurrency caps
+        """
+        self.modes = list(modes)
+        self.size = size
+        self.pool_dir = pool_dir
+        self.index_path = os.path.join(pool_dir, "pool.json")
+        self.lock_path = os.path.join(pool_dir, "refill.lock")
+        self.max_age_seconds = max_age_seconds
+        self.refill_delay = refill_delay
+        self.stage = stage
+
+        self._entries = {mode: [] for mode in self.modes}
+        self._recent = {mode: deque(maxlen=recent_size) for mode in self.modes}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._client = None
+        self._owner_lock = None
+        self._warned = False
+        # Disk work is deferred to the refill thread so take() stays in memory
+        self._dirty = False
+        self._trash = []
+
+        os.makedirs(pool_dir, exist_ok=True)
+
+    # ------------------------
+    # Public API
+    # ------------------------
+
+    def start(self):
+        """
+        Become the pool owner if no other process is. Non-owners never load
+        the index or call Gemini; their /start falls back to live generation.
+        """
+        self._owner_lock = _try_lock(self.lock_path)
+        if self._owner_lock is None:
+            print(f"ℹ️ Opening pool in {self.pool_dir} is owned by another process")
+            return
+
+        self._load()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def take(self, mode: str):
+        """Pop a ready opener as {"question", "audio"} or None if the pool is empty."""
+        if self._thread is None:
+            if self._owner_lock is None and not self._warned:
+                print("⚠️ Opening pool not owned by this process, using live generation")
+                self._warned = True
+            return None
+        with self._lock:
+            self._expire_locked()
+            entries = self._entries.get(mode)
+            if not entries:
+                self._wake.set()
+                return None
+            entry = entries.pop(0)
+            self._recent[mode].append(entry["question"])
+            self._trash.append(entry)
+            self._dirty = True
+
+        self._wake.set()
+        return {"question": entry["question"], "audio": entry["audio"]}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {mode: len(entries) for mode, entries in self._entries.items()}
+
+    # ------------------------
+    # Refill
+    # ------------------------
+
+    def _run(self):
+        failures = 0
+        discards = 0
+        while not self._stop.is_set():
+            self._flush()
+            mode = self._mode_needing_refill()
+            if mode is None:
+                # Wake on take(), or periodically to expire stale openers
+                self._wake.wait(timeout=60)
+                self._wake.clear()
+                continue
+
+            try:
+                added = self._generate_one(mode)
+            except Exception as e:
+                print(f"❌ Opening pool refill failed ({mode}): {e}")
+                added = False
+            else:
+                if not added:
+                    discards += 1
+
+            if added:
+                failures = discards = 0
+                self._stop.wait(self.refill_delay)
+                continue
+
+            if discards >= MAX_CONSECUTIVE_DISCARDS:
+                # Gemini keeps producing the same openers; more calls won't help
+                print(f"⏸️ Opening pool paused after {discards} repeated openers")
+                self._wake.clear()
+                self._wake.wait(timeout=DISCARD_PAUSE_SECONDS)
+                failures = discards = 0
+                continue
+
+            failures += 1
+            self._stop.wait(min(300, self.refill_delay * 2 ** failures))
+
+        self._flush()
+
+    def _mode_needing_refill(self):
+        with self._lock:
+            self._expire_locked()
+            pending = [m for m in self.modes if len(self._entries[m]) < self.size]
+        if not pending:
+            return None
+        return min(pending, key=lambda m: len(self._entries[m]))
+
+    def _opening_prompt(self, mode: str, prompts) -> str:
+        """Start prompt plus a random theme and the openers to steer away from"""
+        with self._lock:
+            avoid = [e["question"] for e in self._entries[mode]] + list(self._recent[mode])
+
+        prompt = prompts.start
+        if prompts.themes:
+            prompt += f"\n\nFocus the first question on this theme: {random.choice(prompts.themes)}."
+        if avoid:
+            listed = "\n".join(f"- {q}" for q in avoid[-AVOID_LIST_SIZE:])
+            prompt += f"\n\nDo not reuse or closely paraphrase any of these earlier openings:\n{listed}"
+        return prompt
+
+    def _generate_one(self, mode: str) -> bool:
+        """Generate one opener. Returns False if it was discarded as a repeat."""
+        if self._client is None:
+            self._client = GeminiClient()
+        prompts = get_registry().get(mode)
+
+        with self.stage("llm"):
+            question = self._client.generate(
+                self._opening_prompt(mode, prompts),
+                system_instruction=prompts.system,
+                temperature=OPENING_TEMPERATURE
+            ).strip()
+
+        if not question or self._is_repeat(mode, question):
+            print(f"♻️ Discarded repeated opener for {mode}")
+            return False
+
+        audio_path = os.path.join(self.pool_dir, f"{mode}_{uuid.uuid4().hex}.mp3")
+        with self.stage("tts"):
+            text_to_mp3(question, audio_path)
+        with open(audio_path, "rb") as f:
+            audio = base64.b64encode(f.read()).decode("utf-8")
+
+        with self._lock:
+            self._entries[mode].append({
+                "mode": mode,
+                "question": question,
+                "audio_path": audio_path,
+                "audio": audio,
+                "created": time.time()
+            })
+            self._dirty = True
+        return True
+
+    def _is_repeat(self, mode: str, question: str) -> bool:
+        with self._lock:
+            seen = [e["question"] for e in self._entries[mode]] + list(self._recent[mode])
+        normalized = question.lower()
+        return any(
+            difflib.SequenceMatcher(None, normalized, other.lower()).ratio() >= SIMILARITY_THRESHOLD
+            for other in seen
+        )
+
+    # ------------------------
+    # Freshness & persistence
+    # ------------------------
+
+    def _expire_locked(self):
+        cutoff = time.time() - self.max_age_seconds
+        for mode, entries in self._entries.items():
+            fresh = [e for e in entries if e["created"] >= cutoff]
+            if len(fresh) != len(entries):
+                self._trash.extend(e for e in entries if e["created"] < cutoff)
+                self._dirty = True
+            self._entries[mode] = fresh
+
+    def _remove_audio(self, entry):
+        try:
+            os.unlink(entry["audio_path"])
+        except OSError:
+            pass
+
+    def _flush(self):
+        """Delete spent audio and persist the index. Only runs on the refill thread."""
+        with self._lock:
+            trash, self._trash = self._trash, []
+            data = None
+            if self._dirty:
+                data = {
+                    "entries": [
+                        {k: v for k, v in e.items() if k != "audio"}
+                        for entries in self._entries.values() for e in entries
+                    ],
+                    "recent": {mode: list(recent) for mode, recent in self._recent.items()}
+                }
+                self._dirty = False
+
+        for entry in trash:
+            self._remove_audio(entry)
+        if data is None:
+            return
+
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"❌ Failed to save opening pool index: {e}")
+            with self._lock:
+                self._dirty = True
+
+    def _remove_orphans(self):
+        """Delete pooled audio that no index entry refers to (e.g. after a crash)"""
+        with self._lock:
+            known = {os.path.abspath(e["audio_path"]) for entries in self._entries.values() for e in entries}
+        for name in os.listdir(self.pool_dir):
+            path = os.path.abspath(os.path.join(self.pool_dir, name))
+            if name.endswith(".mp3") and path not in known:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def _load(self):
+        self._load_index()
+        self._remove_orphans()
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Ignoring unreadable opening pool index: {e}")
+            return
+
+        with self._lock:
+            for mode, recent in data.get("recent", {}).items():
+                if mode in self._recent:
+                    self._recent[mode].extend(recent)
+
+            for entry in data.get("entries", []):
+                mode = entry.get("mode")
+                if mode not in self._entries or not os.path.exists(entry.get("audio_path", "")):
+                    continue
+                with open(entry["audio_path"], "rb") as f:
+                    entry["audio"] = base64.b64encode(f.read()).decode("utf-8")
+                self._entries[mode].append(entry)
+
+            self._expire_locked()
+            self._dirty = True
+
+        print(f"📦 Opening pool restored: {self.stats()}")
@@ -0,0 +1,100 @@
+# backend/conversation/prompt_registry.py
+# Loads every interview mode from backend/prompts/ once and keeps it in a
+# ready-to-send form:
+#   prompts/start.txt, prompts/follow_up.txt   shared defaults for every mode
+#   prompts/<mode>/system.txt    short per-turn rules, sent as the system instruction
+#   prompts/<mode>/themes.txt    optional, one theme per line; opening turn only
+#   prompts/<mode>/start.txt     optional override of the shared opening instruction
+#   prompts/<mode>/follow_up.txt optional override; one {user_text} placeholder
+from functools import lru_cache
+from pathlib import Path
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+PLACEHOLDER = "{user_text}"
+SHARED_FILES = ("start.txt", "follow_up.txt")
+
+
+class InterviewPrompts:
+    def __init__(self, mode: str, system: str, start: str, follow_up: str, themes=None):
+        self.mode = mode
+        self.system = system
+        self.themes = list(themes or [])
+        # Themes only steer the opening question, so they live in the start
+        # prompt and never inflate the per-turn follow-ups
+        if self.themes:
+            start += "\n\nThemes:\n" + "\n".join(f"- {t}" for t in self.themes)
+        self.start = start
+        # Pre-split around the placeholder so each turn is a plain concatenation
+        self._head, self._tail = follow_up.split(PLACEHOLDER)
+
+    def follow_up(self, user_text: str) -> str:
+        return self._head + user_text + self._tail
+
+
+class PromptRegistry:
+    def __init__(self, prompts_dir=PROMPTS_DIR):
+        self.prompts_dir = Path(prompts_dir)
+        self._modes = {}
+
+        defaults = {}
+        for name in SHARED_FILES:
+            path = self.prompts_dir / name
+            if not path.is_file():
+                raise ValueError(f"Shared prompt {path} is missing")
+            defaults[name] = self._read(path)
+
+        for mode_dir in sorted(p for p in self.prompts_dir.iterdir() if p.is_dir()):
+            self._modes[mode_dir.name] = self._load_mode(mode_dir, defaults)
+
+        if not self._modes:
+            raise ValueError(f"No interview modes found in {self.prompts_dir}")
+
+    def _read(self, path: Path) -> str:
+        text = path.read_text(encoding="utf-8").strip()
+        if not text:
+            raise ValueError(f"Prompt file {path} is empty")
+        return text
+
+    def _load_mode(self, mode_dir: Path, defaults: dict) -> InterviewPrompts:
+        system_path = mode_dir / "system.txt"
+        if not system_path.is_file():
+            raise ValueError(f"Prompt mode '{mode_dir.name}' is missing system.txt")
+
+        texts = {"system.txt": self._read(system_path)}
+        for name in SHARED_FILES:
+            path = mode_dir / name
+            texts[name] = self._read(path) if path.is_file() else defaults[name]
+
+        themes = []
+        themes_path = mode_dir / "themes.txt"
+        if themes_path.is_file():
+            themes = [line.strip() for line in self._read(themes_path).splitlines() if line.strip()]
+
+        for name in ("system.txt", "start.txt"):
+            if PLACEHOLDER in texts[name]:
+                raise ValueError(f"{mode_dir.name}/{name} must not contain {PLACEHOLDER}")
+        if texts["follow_up.txt"].count(PLACEHOLDER) != 1:
+            raise ValueError(f"{mode_dir.name}/follow_up.txt must contain {PLACEHOLDER} exactly once")
+
+        return InterviewPrompts(
+            mode=mode_dir.name,
+            system=texts["system.txt"],
+            start=texts["start.txt"],
+            follow_up=texts["follow_up.txt"],
+            themes=themes
+        )
+
+    @property
+    def modes(self):
+        return list(self._modes)
+
+    def get(self, mode: str) -> InterviewPrompts:
+        if mode not in self._modes:
+            raise ValueError(f"Unknown interview mode '{mode}'. Available: {', '.join(self._modes)}")
+        return self._modes[mode]
+
+
+@lru_cache(maxsize=None)
+def get_registry() -> PromptRegistry:
+    """Shared registry, loaded and validated on first use"""
+    return PromptRegistry()
@@ -0,0 +1,101 @@
+# backend/conversation/transcript_log.py
+# Append-only per-session transcript/event log.
+# One JSON object per line in logs/transcripts/<session_id>.jsonl. Events are
+# queued from the request path and written in batches by a background thread.
+import atexit
+import hashlib
+import json
+import os
+import queue
+import re
+import threading
+import time
+
+_SAFE_ID = re.compile(r"[^A-Za-z0-9_.-]")
+MAX_SESSION_ID = 64
+
+
+def bounded_session_id(session_id: str) -> str:
+    """
+    Filesystem-safe id of at most MAX_SESSION_ID characters. Ids that had to
+    be cleaned or shortened get a hash suffix so they stay distinct.
+    """
+    safe = _SAFE_ID.sub("_", session_id)
+    if safe and safe == session_id and len(safe) <= MAX_SESSION_ID:
+        return safe
+    digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()[:12]
+    return f"{safe[:MAX_SESSION_ID - 13]}-{digest}"
+
+
+def session_log_path(log_dir: str, session_id: str) -> str:
+    return os.path.join(log_dir, f"{bounded_session_id(session_id)}.jsonl")
+
+
+def read_session(path: str):
+    """Yield events from a session log, skipping a torn last line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+class TranscriptLog:
+    def __init__(self, log_dir: str = "logs/transcripts",
+                 batch_size: int = 32, flush_interval: float = 1.0):
+        self.log_dir = log_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._stopped = False
+
+        os.makedirs(log_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, session_id: str, event: str, **fields):
+        """Queue an event. Never blocks on disk."""
+        entry = {"t": round(time.time(), 3), "event": event}
+        entry.update(fields)
+        self._queue.put((session_id, entry))
+
+    def close(self):
+        if self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            done = batch[-1] is None
+            self._write([item for item in batch if item is not None])
+            if done:
+                return
+
+    def _write(self, batch):
+        by_session = {}
+        for session_id, entry in batch:
+            line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+            by_session.setdefault(session_id, []).append(line)
+
+        for session_id, lines in by_session.items():
+            path = session_log_path(self.log_dir, session_id)
+            try:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                print(f"❌ Failed to write transcript log {path}: {e}")
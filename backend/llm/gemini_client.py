@@ -2,6 +2,7 @@
 import os
 from dotenv import load_dotenv
 from google import genai
+from google.genai import types
 
 load_dotenv()
 
@@ -14,9 +15,30 @@ class GeminiClient:
         self.client = genai.Client(api_key=api_key)
         # Free-tier friendly model
         self.model_name = "gemini-2.5-flash"
-    def generate(self, prompt):
+
+    def _config(self, system_instruction=None, temperature=None):
+        if system_instruction is None and temperature is None:
+            return None
+        return types.GenerateContentConfig(
+            system_instruction=system_instruction,
+            temperature=temperature
+        )
+
+    def generate(self, prompt, system_instruction=None, temperature=None):
          response = self.client.models.generate_content(
         model=self.model_name,
-        contents=prompt
+        contents=prompt,
+        config=self._config(system_instruction, temperature)
          )
          return response.text
+
+    def generate_stream(self, prompt, system_instruction=None):
+        """Yield the response text chunk by chunk as Gemini produces it"""
+        stream = self.client.models.generate_content_stream(
+            model=self.model_name,
+            contents=prompt,
+            config=self._config(system_instruction)
+        )
+        for chunk in stream:
+            if chunk.text:
+                yield chunk.text
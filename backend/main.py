@@ -1,17 +1,27 @@
+import argparse
+import re
+import tempfile
+import threading
 import time
 
 from llm.gemini_client import GeminiClient
-from stt.whisper_stt import transcribe_audio
-from tts.local_tts import synthesize_speech
-from utils.audio_recorder import record_audio
+from stt.whisper_stt import transcribe_audio, transcribe_samples, preload
+from tts.local_tts import synthesize_speech, text_to_mp3
+from utils.audio_recorder import record_audio, StreamingRecorder
+from utils.audio_sink import AudioSink
 from conversation.interview_manager import InterviewManager
+from conversation.prompt_registry import get_registry
 
 AUDIO_INPUT_PATH = "audio/input/user.wav"
+EXIT_WORDS = ["exit", "quit", "stop"]
+GOODBYE = "Thank you for your time. Have a great day."
 
-def main():
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+def main(mode="general"):
     print("🎤 ARAI Virtual Interviewer (Free Stack) starting...")
 
-    interview_manager = InterviewManager(mode="general")
+    interview_manager = InterviewManager(mode=mode)
 
     # Model speaks first
     first_question = interview_manager.start_interview()
@@ -26,9 +36,9 @@ def main():
         user_text = transcribe_audio(AUDIO_INPUT_PATH)
         print(f"User: {user_text}")
 
-        if user_text.strip().lower() in ["exit", "quit", "stop"]:
+        if user_text.strip().lower() in EXIT_WORDS:
             print("Ending interview session.")
-            synthesize_speech("Thank you for your time. Have a great day.")
+            synthesize_speech(GOODBYE)
             break
 
         next_question = interview_manager.next_question(user_text)
@@ -37,5 +47,98 @@ def main():
 
         time.sleep(0.3)
 
+# ------------------------
+# Streaming mode
+# ------------------------
+
+def _sentences(chunks):
+    """Regroup streamed LLM chunks into whole sentences"""
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        parts = _SENTENCE_END.split(buffer)
+        buffer = parts.pop()
+        for sentence in parts:
+            if sentence.strip():
+                yield sentence.strip()
+    if buffer.strip():
+        yield buffer.strip()
+
+def _synthesize_to_temp(text):
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
+    temp_file.close()
+    text_to_mp3(text, temp_file.name)
+    return temp_file.name
+
+def speak_streaming(chunks, sink):
+    """
+    Synthesize and queue each sentence as soon as it is complete, so the
+    next sentence is generated and synthesized while the previous one plays.
+    """
+    print("\nARAI: ", end="", flush=True)
+    for sentence in _sentences(chunks):
+        print(sentence, end=" ", flush=True)
+        sink.play(_synthesize_to_temp(sentence), cleanup=True)
+    print()
+
+def main_streaming(mode="general"):
+    print("🎤 ARAI Virtual Interviewer (streaming) starting...")
+
+    interview_manager = InterviewManager(mode=mode)
+    sink = AudioSink()
+    recorder = StreamingRecorder()
+    recorder.start()
+
+    # Load Whisper and pre-render the goodbye while the first question plays
+    goodbye = {}
+    def warm_up():
+        # Best effort: anything that fails here is simply done on demand later
+        try:
+            preload()
+            goodbye["path"] = _synthesize_to_temp(GOODBYE)
+        except Exception as e:
+            print(f"⚠️ Warm-up failed, continuing without it: {e}")
+    warmup = threading.Thread(target=warm_up, daemon=True)
+    warmup.start()
+
+    speak_streaming(interview_manager.start_interview_stream(), sink)
+
+    try:
+        while True:
+            # Don't listen while ARAI is talking, the mic would pick it up
+            sink.wait()
+            print("\nListening to user... (speak now)")
+            samples = recorder.listen()
+            if samples is None:
+                continue
+
+            user_text = transcribe_samples(samples)
+            print(f"User: {user_text}")
+            if not user_text:
+                continue
+
+            if user_text.strip().lower().strip(".!?") in EXIT_WORDS:
+                print("Ending interview session.")
+                warmup.join()
+                if "path" not in goodbye:
+                    goodbye["path"] = _synthesize_to_temp(GOODBYE)
+                sink.play(goodbye["path"], cleanup=True)
+                sink.wait()
+                break
+
+            speak_streaming(interview_manager.next_question_stream(user_text), sink)
+    finally:
+        recorder.stop()
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="ARAI Virtual Interviewer CLI")
+    parser.add_argument("--stream", action="store_true",
+                        help="event-driven mode: endpointed mic capture, streamed replies, non-blocking playback")
+    parser.add_argument("--mode", default="general", choices=get_registry().modes,
+                        help="interview mode (prompt set under prompts/)")
+    args = parser.parse_args()
+
+    if args.stream:
+        main_streaming(args.mode)
+    else:
+        main(args.mode)
@@ -0,0 +1,100 @@
+"""
+Replay recorded interview sessions through the STT/LLM/TTS stages
+and compare stage latencies against what was recorded live.
+
+Usage:
+    python replay.py logs/transcripts/<session>.jsonl [more.jsonl ...] [--stages stt,llm,tts]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from conversation.transcript_log import read_session
+
+STAGES = ("stt", "llm", "tts")
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, round((time.perf_counter() - start) * 1000, 1)
+
+
+def replay_session(path, stages):
+    # Imported lazily so replaying only one stage does not load the others
+    transcribe_audio = text_to_mp3 = manager = None
+    if "stt" in stages:
+        from stt.whisper_stt import transcribe_audio
+    if "tts" in stages:
+        # Generate only, playback would make tts_ms measure clip length
+        from tts.local_tts import text_to_mp3
+    if "llm" in stages:
+        from conversation.interview_manager import InterviewManager
+
+    rows = []
+    for event in read_session(path):
+        kind = event.get("event")
+        replayed = {}
+
+        if kind == "start":
+            # Each start opens a fresh conversation, as it did live
+            if "llm" in stages:
+                manager = InterviewManager(mode=event.get("mode", "general"))
+                _, replayed["llm_ms"] = _timed(manager.start_interview)
+        elif kind in ("turn", "end"):
+            user_text = event.get("user", "")
+            audio_in = event.get("audio_in")
+
+            if transcribe_audio and audio_in and os.path.exists(audio_in):
+                user_text, replayed["stt_ms"] = _timed(transcribe_audio, audio_in)
+            if manager is not None and kind == "turn":
+                _, replayed["llm_ms"] = _timed(manager.next_question, user_text)
+        else:
+            continue
+
+        if text_to_mp3:
+            out = os.path.join(tempfile.gettempdir(), "arai_replay.mp3")
+            _, replayed["tts_ms"] = _timed(text_to_mp3, event.get("question", ""), out)
+
+        rows.append((kind, event, replayed))
+    return rows
+
+
+def print_report(path, rows, stages):
+    print(f"\n📼 {path}")
+    header = f"{'#':>3} {'event':<6}" + "".join(f"{s + ' rec':>12}{s + ' now':>12}" for s in stages)
+    print(header)
+
+    totals = {s: [0.0, 0.0] for s in stages}
+    for i, (kind, event, replayed) in enumerate(rows):
+        line = f"{i:>3} {kind:<6}"
+        for s in stages:
+            rec = event.get(f"{s}_ms")
+            now = replayed.get(f"{s}_ms")
+            line += f"{rec if rec is not None else '-':>12}{now if now is not None else '-':>12}"
+            if rec is not None and now is not None:
+                totals[s][0] += rec
+                totals[s][1] += now
+        print(line)
+
+    for s, (rec, now) in totals.items():
+        if rec:
+            print(f"   {s}: recorded {rec:.0f} ms, replayed {now:.0f} ms ({(now - rec) / rec:+.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded ARAI interview sessions")
+    parser.add_argument("logs", nargs="+", help="session .jsonl files")
+    parser.add_argument("--stages", default=",".join(STAGES),
+                        help="comma separated subset of stt,llm,tts")
+    args = parser.parse_args()
+
+    stages = [s for s in args.stages.split(",") if s in STAGES]
+    for path in args.logs:
+        print_report(path, replay_session(path, stages), stages)
+
+
+if __name__ == "__main__":
+    main()
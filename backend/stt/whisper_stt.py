@@ -1,15 +1,32 @@
 # backend/stt/whisper_stt.py
+import threading
+
+import numpy as np
 import whisper
 
 _model = None
+_model_lock = threading.Lock()
 
 def _load_model():
     global _model
-    if _model is None:
-        _model = whisper.load_model("base")
+    # Preload may run on a warm-up thread while the first answer is transcribed
+    with _model_lock:
+        if _model is None:
+            _model = whisper.load_model("base")
     return _model
 
 def transcribe_audio(audio_path: str) -> str:
     model = _load_model()
     result = model.transcribe(audio_path)
     return result.get("text", "").strip()
+
+def transcribe_samples(samples) -> str:
+    """Transcribe 16kHz mono int16 samples straight from memory"""
+    model = _load_model()
+    audio = samples.reshape(-1).astype(np.float32) / 32768.0
+    result = model.transcribe(audio, fp16=False)
+    return result.get("text", "").strip()
+
+def preload():
+    """Load the model ahead of the first transcription"""
+    _load_model()
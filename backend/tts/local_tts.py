@@ -9,6 +9,11 @@ import time
 # Initialize pygame mixer once
 pygame.mixer.init()
 
+def text_to_mp3(text: str, output_path: str):
+    """Generate speech into an mp3 file without playing it."""
+    tts = gTTS(text=text, lang='en', slow=False)
+    tts.save(output_path)
+
 def synthesize_speech(text: str, output_path: str = None):
     """Synthesize speech from text and play it using Google TTS."""
     print(f"🔊 Speaking: '{text[:50]}...'")
@@ -23,8 +28,7 @@ def synthesize_speech(text: str, output_path: str = None):
             temp_created = True
         
         # Generate speech
-        tts = gTTS(text=text, lang='en', slow=False)
-        tts.save(output_path)
+        text_to_mp3(text, output_path)
         
         # Play the audio using pygame
         pygame.mixer.music.load(output_path)
@@ -0,0 +1,144 @@
+# backend/utils/admission.py
+# Admission control for the interview endpoints.
+# Bounds how many requests run ffmpeg/Whisper/Gemini/TTS at once, keeps a short
+# bounded wait queue, and rate-limits each session and client address with
+# token buckets.
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Overloaded(Exception):
+    """Server is at capacity and the wait queue is full or timed out (503)."""
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimited(Exception):
+    """Session exceeded its request budget (429)."""
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self) -> float:
+        """Refill, then return 0 if a token is available, else seconds until one is."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> float:
+        """Consume one token. Returns 0 on success, else seconds until one is available."""
+        wait = self.wait_time()
+        if wait == 0:
+            self.tokens -= 1
+        return wait
+
+
+class AdmissionController:
+    def __init__(self, max_inflight: int = 4, max_queue: int = 8,
+                 queue_timeout: float = 5.0, stage_limits: dict = None,
+                 session_rate: float = 0.5, session_burst: int = 3,
+                 address_rate: float = 2.0, address_burst: int = 10,
+                 session_idle_seconds: float = 600.0):
+        """
+        Every request is charged against its client-chosen session id and
+        against the client address. The session bucket keeps one candidate's
+        pace; the looser address bucket stops a client that rotates session
+        ids, while leaving room for several candidates behind one NAT.
+        """
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.session_rate = session_rate
+        self.session_burst = session_burst
+        self.address_rate = address_rate
+        self.address_burst = address_burst
+        self.session_idle_seconds = session_idle_seconds
+
+        self._slots = threading.BoundedSemaphore(max_inflight)
+        self._stages = {
+            name: threading.BoundedSemaphore(limit)
+            for name, limit in (stage_limits or {}).items()
+        }
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._buckets = {}
+
+    def _bucket(self, key, rate: float, burst: int) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._prune_buckets()
+            bucket = TokenBucket(rate, burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _check_rate(self, session_id: str, address: str):
+        with self._lock:
+            buckets = [
+                self._bucket(("session", session_id), self.session_rate, self.session_burst),
+                self._bucket(("address", address), self.address_rate, self.address_burst)
+            ]
+            # Only charge if every bucket has a token, so a rejection costs nothing
+            wait = max(bucket.wait_time() for bucket in buckets)
+            if wait == 0:
+                for bucket in buckets:
+                    bucket.take()
+
+        if wait > 0:
+            raise RateLimited("Too many requests for this session", math.ceil(wait))
+
+    def _prune_buckets(self):
+        cutoff = time.monotonic() - self.session_idle_seconds
+        stale = [key for key, b in self._buckets.items() if b.updated < cutoff]
+        for key in stale:
+            del self._buckets[key]
+
+    @contextmanager
+    def admit(self, session_id: str, address: str):
+        """Hold one global slot for the duration of a request."""
+        self._check_rate(session_id, address)
+
+        # Fast path: free slot, no queueing
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                if self._waiting >= self.max_queue:
+                    raise Overloaded("Server busy, queue full",
+                                     math.ceil(self.queue_timeout))
+                self._waiting += 1
+            try:
+                acquired = self._slots.acquire(timeout=self.queue_timeout)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            if not acquired:
+                raise Overloaded("Server busy, timed out waiting for a slot",
+                                 math.ceil(self.queue_timeout))
+
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Limit concurrency of a single pipeline stage (ffmpeg, stt, llm, tts)."""
+        semaphore = self._stages.get(name)
+        if semaphore is None:
+            yield
+            return
+
+        with semaphore:
+            yield
@@ -1,7 +1,11 @@
 # backend/utils/audio_recorder.py
 import sounddevice as sd
 from scipy.io.wavfile import write
+from collections import deque
+import numpy as np
 import os
+import queue
+import time
 
 def record_audio(output_path: str, duration: int = 6, fs: int = 16000):
     print(f"🎙️ Recording for {duration} seconds...")
@@ -11,3 +15,90 @@ def record_audio(output_path: str, duration: int = 6, fs: int = 16000):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     write(output_path, fs, recording)
     print("✅ Recording saved.")
+
+
+class StreamingRecorder:
+    """
+    Keeps the microphone open and endpoints utterances automatically.
+
+    The sounddevice callback only copies blocks into a queue; listen() pulls
+    them out, keeps a short pre-roll ring so the first syllable is not lost,
+    and stops once the speaker has been quiet for `silence_ms`.
+    """
+
+    def __init__(self, fs: int = 16000, block_ms: int = 30,
+                 silence_ms: int = 700, preroll_ms: int = 300,
+                 max_seconds: float = 30.0, min_threshold: float = 400.0):
+        self.fs = fs
+        self.block_size = int(fs * block_ms / 1000)
+        self.silence_blocks = silence_ms // block_ms
+        self.max_blocks = int(max_seconds * 1000 / block_ms)
+        self.min_threshold = min_threshold
+        self.noise_floor = min_threshold / 3
+
+        self._blocks = queue.Queue()
+        self._preroll = deque(maxlen=max(1, preroll_ms // block_ms))
+        self._stream = sd.InputStream(
+            samplerate=fs, channels=1, dtype="int16",
+            blocksize=self.block_size, callback=self._callback
+        )
+
+    def _callback(self, indata, frames, time_info, status):
+        self._blocks.put(indata.copy())
+
+    def start(self):
+        self._stream.start()
+
+    def stop(self):
+        self._stream.stop()
+        self._stream.close()
+
+    def flush(self):
+        """Drop everything captured so far (e.g. while the interviewer was speaking)"""
+        while True:
+            try:
+                self._blocks.get_nowait()
+            except queue.Empty:
+                break
+        self._preroll.clear()
+
+    def _is_speech(self, block) -> bool:
+        rms = float(np.sqrt(np.mean(block.astype(np.float32) ** 2)))
+        threshold = max(self.min_threshold, self.noise_floor * 3)
+        if rms < threshold:
+            # Track background level only while nobody is talking
+            self.noise_floor = 0.95 * self.noise_floor + 0.05 * rms
+            return False
+        return True
+
+    def listen(self, timeout: float = 15.0):
+        """Block until one utterance has been captured. Returns int16 samples or None."""
+        self.flush()
+        speech = []
+        silent = 0
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                block = self._blocks.get(timeout=0.5)
+            except queue.Empty:
+                block = None
+
+            if not speech:
+                if time.monotonic() > deadline:
+                    return None
+                if block is None:
+                    continue
+                if self._is_speech(block):
+                    speech.extend(self._preroll)
+                    speech.append(block)
+                else:
+                    self._preroll.append(block)
+                continue
+
+            if block is None:
+                continue
+            speech.append(block)
+            silent = 0 if self._is_speech(block) else silent + 1
+            if silent >= self.silence_blocks or len(speech) >= self.max_blocks:
+                return np.concatenate(speech)
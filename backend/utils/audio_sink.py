@@ -0,0 +1,44 @@
+# backend/utils/audio_sink.py
+# Non-blocking playback: play() queues a file and returns immediately,
+# a background thread plays queued files back to back through pygame.
+import os
+import queue
+import threading
+import time
+
+import pygame
+
+
+class AudioSink:
+    def __init__(self):
+        pygame.mixer.init()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def play(self, path: str, cleanup: bool = False):
+        """Queue a file for playback. If cleanup is set the file is deleted afterwards."""
+        self._queue.put((path, cleanup))
+
+    def wait(self):
+        """Block until everything queued so far has finished playing."""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            path, cleanup = self._queue.get()
+            try:
+                pygame.mixer.music.load(path)
+                pygame.mixer.music.play()
+                while pygame.mixer.music.get_busy():
+                    time.sleep(0.02)
+                pygame.mixer.music.unload()
+            except Exception as e:
+                print(f"❌ Error during playback: {e}")
+            finally:
+                if cleanup:
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                self._queue.task_done()
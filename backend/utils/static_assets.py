@@ -0,0 +1,185 @@
+# backend/utils/static_assets.py
+# In-memory static asset pipeline for the web AR frontend.
+# Everything under web_ar/ is read once at startup, hashed and pre-compressed,
+# so page loads never touch disk or spend CPU in the request worker.
+import gzip
+import hashlib
+import mimetypes
+import os
+import shutil
+import subprocess
+from collections import defaultdict
+from pathlib import Path
+
+from flask import Response, abort, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+mimetypes.add_type("model/gltf-binary", ".glb")
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# Only keep a compressed variant if it saves at least 10%
+MIN_COMPRESSION_GAIN = 0.9
+
+# Files that reference other assets and get versioned URLs rewritten in
+VERSIONED_ENTRYPOINTS = ("index.html",)
+
+
+def optimize_glb(input_path, output_path) -> bool:
+    """Run gltfpack (meshoptimizer) over a GLB. Returns False if unavailable."""
+    if shutil.which("gltfpack") is None:
+        print("⚠️ gltfpack not found in PATH, serving original GLB")
+        return False
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    subprocess.run([
+        "gltfpack",
+        "-i", str(input_path),
+        "-o", str(output_path),
+    ], check=True)
+    return True
+
+
+class Asset:
+    def __init__(self, rel_path: str, data: bytes):
+        self.rel_path = rel_path
+        self.mimetype = mimetypes.guess_type(rel_path)[0] or "application/octet-stream"
+        self.variants = {}
+        self.set_data(data)
+
+    def set_data(self, data: bytes):
+        self.digest = hashlib.sha256(data).hexdigest()[:16]
+        self.variants = {"identity": data}
+
+        compressed = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed["br"] = brotli.compress(data, quality=11)
+
+        for encoding, body in compressed.items():
+            if len(body) < len(data) * MIN_COMPRESSION_GAIN:
+                self.variants[encoding] = body
+
+    def etag(self, encoding: str) -> str:
+        if encoding == "identity":
+            return self.digest
+        return f"{self.digest}-{encoding}"
+
+    def best_encoding(self, accepted) -> str:
+        """Smallest variant the client accepts"""
+        candidates = [
+            enc for enc in self.variants
+            if enc == "identity" or accepted[enc] > 0
+        ]
+        return min(candidates, key=lambda enc: len(self.variants[enc]))
+
+
+class StaticAssets:
+    def __init__(self, root_dir, optimize_models: bool = False, cache_dir=None):
+        self.root_dir = Path(root_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.optimized = {}
+        self.assets = {}
+        # rel_path -> True if fetched through a content-hashed (immutable) URL
+        self.page_assets = {}
+
+        for path in sorted(self.root_dir.rglob("*")):
+            if not path.is_file():
+                continue
+            rel_path = path.relative_to(self.root_dir).as_posix()
+
+            if optimize_models and path.suffix == ".glb" and self.cache_dir:
+                path = self._optimized_model(path, rel_path)
+
+            self.assets[rel_path] = Asset(rel_path, path.read_bytes())
+
+        for rel_path in VERSIONED_ENTRYPOINTS:
+            if rel_path in self.assets:
+                self._version_references(self.assets[rel_path])
+
+    def _optimized_model(self, path: Path, rel_path: str) -> Path:
+        out_path = self.cache_dir / rel_path
+        try:
+            if (not out_path.exists()
+                    or out_path.stat().st_mtime < path.stat().st_mtime):
+                if not optimize_glb(path, out_path):
+                    return path
+        except subprocess.CalledProcessError as e:
+            print(f"❌ GLB optimization failed for {rel_path}: {e}")
+            return path
+
+        if out_path.stat().st_size >= path.stat().st_size:
+            return path
+        self.optimized[rel_path] = (path.stat().st_size, out_path.stat().st_size)
+        return out_path
+
+    def _version_references(self, entry: Asset):
+        """Point the entrypoint at content-hashed URLs so they can be cached forever"""
+        text = entry.variants["identity"].decode("utf-8")
+        self.page_assets[entry.rel_path] = False
+        for rel_path, asset in self.assets.items():
+            if asset is entry or f'"/{rel_path}"' not in text:
+                continue
+            text = text.replace(f'"/{rel_path}"', f'"/{rel_path}?v={asset.digest}"')
+            self.page_assets[rel_path] = True
+        entry.set_data(text.encode("utf-8"))
+
+    def serve(self, rel_path: str) -> Response:
+        asset = self.assets.get(rel_path)
+        if asset is None:
+            abort(404)
+
+        encoding = asset.best_encoding(request.accept_encodings)
+        etag = asset.etag(encoding)
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(asset.variants[encoding], mimetype=asset.mimetype)
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+
+        response.set_etag(etag)
+        response.headers["Vary"] = "Accept-Encoding"
+        if request.args.get("v") == asset.digest:
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE
+        else:
+            response.headers["Cache-Control"] = REVALIDATE_CACHE
+        return response
+
+    def report(self, accepted=None) -> str:
+        """
+        Bytes transferred per page load, counting only the entrypoint and the
+        assets it references. `accepted` lists the client's encodings and
+        defaults to everything a modern browser sends.
+        Cold = empty browser cache, body bytes of the chosen encoding.
+        Warm = unversioned files revalidate with a 304 (no body), versioned
+        files are served from the browser cache without a request.
+        """
+        accepted = defaultdict(int, {enc: 1 for enc in (accepted or ("br", "gzip"))})
+        lines = [f"{'Asset':<28}{'Raw':>12}{'Cold':>12}{'Enc':>10}{'Warm':>8}"]
+        raw_total = cold_total = revalidations = 0
+
+        for rel_path, immutable in self.page_assets.items():
+            asset = self.assets[rel_path]
+            encoding = asset.best_encoding(accepted)
+            raw = len(asset.variants["identity"])
+            cold = len(asset.variants[encoding])
+            raw_total += raw
+            cold_total += cold
+            if immutable:
+                warm = "0"
+            else:
+                warm = "304"
+                revalidations += 1
+            lines.append(f"{rel_path:<28}{raw:>12,}{cold:>12,}{encoding:>10}{warm:>8}")
+
+        lines.append(f"{'TOTAL':<28}{raw_total:>12,}{cold_total:>12,}{'':>10}{'0':>8}")
+        lines.append(f"Warm load: 0 body bytes, {revalidations} conditional request(s) answered with 304")
+
+        for rel_path, (before, after) in self.optimized.items():
+            lines.append(f"{rel_path}: mesh-optimized {before:,} -> {after:,} bytes")
+        return "\n".join(lines)
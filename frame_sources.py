@@ -0,0 +1,210 @@
+import cv2
+import numpy as np
+
+
+class FrameSource:
+    """
+    Base class for anything that can feed frames into the VR converter
+
+    Subclasses implement read() with the same (ret, frame) contract as
+    cv2.VideoCapture.read(), so the converter does not care where frames
+    come from. Seekable sources support deterministic playback, which is
+    what the headless benchmark relies on.
+    """
+    name = "source"
+    seekable = False
+    # Real footage is mirrored for display; synthetic frames already read correctly
+    mirror = True
+
+    def read(self):
+        """Return (ret, frame) for the next frame"""
+        raise NotImplementedError
+
+    def seek(self, index):
+        """Jump to frame `index`. Returns False if the source is live"""
+        return False
+
+    def release(self):
+        """Free any underlying device or file handle"""
+        pass
+
+    def __iter__(self):
+        while True:
+            ret, frame = self.read()
+            if not ret:
+                return
+            yield frame
+
+
+class CameraSource(FrameSource):
+    """Live webcam feed. Not seekable."""
+    name = "camera"
+
+    def __init__(self, index=0):
+        self.index = index
+        self.cap = cv2.VideoCapture(index)
+        if not self.cap.isOpened():
+            raise Exception(f"Cannot open camera: {index}")
+
+    def read(self):
+        return self.cap.read()
+
+    def release(self):
+        self.cap.release()
+
+
+class FileSource(FrameSource):
+    """
+    Video file playback
+
+    Parameters:
+    path: path to the video file
+    loop: rewind to the first frame when the file ends instead of
+          reporting end-of-stream
+    """
+    name = "file"
+    seekable = True
+
+    def __init__(self, path, loop=False):
+        self.path = path
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise Exception(f"Cannot open video: {path}")
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret and self.loop:
+            self.seek(0)
+            ret, frame = self.cap.read()
+        return ret, frame
+
+    def seek(self, index):
+        return self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+
+    def release(self):
+        self.cap.release()
+
+
+class ArraySource(FrameSource):
+    """
+    Frames held in memory (a list of BGR images or an N x H x W x 3 array)
+
+    Handy for feeding a fixed clip through the stereo pipeline without
+    touching disk or a device.
+    """
+    name = "array"
+    seekable = True
+
+    def __init__(self, frames, loop=True):
+        if len(frames) == 0:
+            raise ValueError("ArraySource needs at least one frame")
+        self.frames = frames
+        self.loop = loop
+        self.position = 0
+
+    def read(self):
+        if self.position >= len(self.frames):
+            if not self.loop:
+                return False, None
+            self.position = 0
+        frame = self.frames[self.position]
+        self.position += 1
+        return True, frame
+
+    def seek(self, index):
+        if not 0 <= index < len(self.frames):
+            return False
+        self.position = index
+        return True
+
+
+class TestPatternSource(ArraySource):
+    """
+    Synthetic test pattern used when no camera is available
+
+    The pattern is drawn once and the same read-only image is handed out
+    on every read, so the per-frame cost is zero.
+    """
+    name = "test_pattern"
+    mirror = False
+
+    def __init__(self, width=640, height=480):
+        frame = create_test_pattern(width, height)
+        frame.flags.writeable = False
+        super().__init__([frame], loop=True)
+
+
+def create_test_pattern(width=640, height=480):
+    """Draw the colourful grid/circle test pattern"""
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+    # Draw grid
+    for i in range(0, width, 40):
+        cv2.line(frame, (i, 0), (i, height), (100, 100, 100), 1)
+    for i in range(0, height, 40):
+        cv2.line(frame, (0, i), (width, i), (100, 100, 100), 1)
+
+    # Draw center cross
+    cv2.line(frame, (width//2, 0), (width//2, height), (0, 255, 0), 2)
+    cv2.line(frame, (0, height//2), (width, height//2), (0, 255, 0), 2)
+
+    # Draw depth test object
+    center = (width//2, height//2)
+    cv2.circle(frame, center, 50, (255, 0, 0), -1)  # Blue circle
+
+    # Add text
+    cv2.putText(frame, "VR TEST PATTERN", (width//4, 50),
+               cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    cv2.putText(frame, "Connect a camera for live feed", (width//6, height-50),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
+
+    return frame
+
+
+def _probe(source):
+    """Make sure a freshly opened source can actually deliver a frame"""
+    ret, frame = source.read()
+    if not ret:
+        source.release()
+        raise Exception("Cannot read from camera/video")
+    print(f"Camera resolution: {frame.shape[1]}x{frame.shape[0]}")
+    if source.seekable:
+        source.seek(0)
+    return source
+
+
+def open_frame_source(camera_source=0, max_camera_index=5):
+    """
+    Resolve a user-facing camera_source value into a FrameSource
+
+    camera_source may be a camera index, a video file path, the string
+    'test_pattern', or an existing FrameSource. If the requested device
+    or file cannot be opened, the first working camera index is used,
+    and failing that the cached test pattern.
+    """
+    if isinstance(camera_source, FrameSource):
+        return camera_source
+    if camera_source == 'test_pattern':
+        return TestPatternSource()
+
+    try:
+        if isinstance(camera_source, str):
+            print(f"Loading video: {camera_source}")
+            return _probe(FileSource(camera_source))
+        print(f"Using camera index: {camera_source}")
+        return _probe(CameraSource(camera_source))
+    except Exception as e:
+        print(f"Error setting up camera: {e}")
+        print("\nTrying different camera indices...")
+
+    for i in range(max_camera_index):
+        try:
+            source = _probe(CameraSource(i))
+        except Exception:
+            continue
+        print(f"Successfully opened camera {i}")
+        return source
+
+    print("No camera found! Using test pattern instead.")
+    return TestPatternSource()
@@ -1,17 +1,23 @@
+import time
+
 import cv2
 import numpy as np
 
+from frame_sources import open_frame_source
+
 class SimpleVRConverter:
-    def __init__(self, camera_source=0):
+    def __init__(self, camera_source=0, headless=False):
         """
         Initialize the VR converter
         
         Parameters:
         camera_source: 0 for default webcam, 1 for second camera,
-                      or 'path/to/video.mp4' for video file
+                      'path/to/video.mp4' for video file, 'test_pattern',
+                      or any FrameSource instance
+        headless: skip creating display windows (for benchmarking)
         """
         self.camera_source = camera_source
-        self.cap = None
+        self.source = None
         
         # VR settings
         self.depth = 40          # 3D depth effect (0-100)
@@ -22,49 +28,16 @@ class SimpleVRConverter:
         self.setup_camera()
         
         # Setup display windows
-        self.setup_windows()
+        if not headless:
+            self.setup_windows()
         
     def setup_camera(self):
-        """Setup camera based on source type"""
-        try:
-            # Check if it's a file path or camera index
-            if isinstance(self.camera_source, str):
-                self.cap = cv2.VideoCapture(self.camera_source)
-                print(f"Loading video: {self.camera_source}")
-            else:
-                self.cap = cv2.VideoCapture(self.camera_source)
-                print(f"Using camera index: {self.camera_source}")
-            
-            if not self.cap.isOpened():
-                raise Exception(f"Cannot open camera/video: {self.camera_source}")
-                
-            # Test capture
-            ret, test_frame = self.cap.read()
-            if not ret:
-                raise Exception("Cannot read from camera/video")
-                
-            print(f"Camera resolution: {test_frame.shape[1]}x{test_frame.shape[0]}")
-            
-        except Exception as e:
-            print(f"Error setting up camera: {e}")
-            print("\nTrying different camera indices...")
-            self.try_different_cameras()
-    
-    def try_different_cameras(self):
-        """Try different camera indices if default fails"""
-        for i in range(5):  # Try first 5 camera indices
-            self.cap = cv2.VideoCapture(i)
-            if self.cap.isOpened():
-                print(f"Found camera at index {i}")
-                ret, frame = self.cap.read()
-                if ret:
-                    print(f"Successfully opened camera {i}")
-                    self.camera_source = i
-                    return
-            self.cap.release()
-        
-        print("No camera found! Using test pattern instead.")
-        self.camera_source = 'test_pattern'
+        """Open the frame source (camera, video file or test pattern)"""
+        self.source = open_frame_source(self.camera_source)
+        if self.source.name == 'test_pattern':
+            self.camera_source = 'test_pattern'
+        elif self.source.name == 'camera':
+            self.camera_source = self.source.index
     
     def setup_windows(self):
         """Create display windows and controls"""
@@ -112,34 +85,6 @@ class SimpleVRConverter:
         """Callback for brightness adjustment"""
         self.brightness = val - 50  # Center at 0
     
-    def create_test_pattern(self):
-        """Create a test pattern when no camera is available"""
-        # Create a colorful test pattern
-        height, width = 480, 640
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        # Draw grid
-        for i in range(0, width, 40):
-            cv2.line(frame, (i, 0), (i, height), (100, 100, 100), 1)
-        for i in range(0, height, 40):
-            cv2.line(frame, (0, i), (width, i), (100, 100, 100), 1)
-        
-        # Draw center cross
-        cv2.line(frame, (width//2, 0), (width//2, height), (0, 255, 0), 2)
-        cv2.line(frame, (0, height//2), (width, height//2), (0, 255, 0), 2)
-        
-        # Draw depth test object
-        center = (width//2, height//2)
-        cv2.circle(frame, center, 50, (255, 0, 0), -1)  # Blue circle
-        
-        # Add text
-        cv2.putText(frame, "VR TEST PATTERN", (width//4, 50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-        cv2.putText(frame, "Connect a camera for live feed", (width//6, height-50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
-        
-        return frame
-    
     def create_vr_frame(self, frame):
         """
         Convert normal frame to VR side-by-side view
@@ -150,9 +95,6 @@ class SimpleVRConverter:
         Returns:
             VR frame in side-by-side format
         """
-        if self.camera_source == 'test_pattern':
-            frame = self.create_test_pattern()
-        
         h, w = frame.shape[:2]
         
         if not self.enable_3d:
@@ -277,18 +219,18 @@ class SimpleVRConverter:
         while True:
             if not paused:
                 # Capture frame
-                if self.camera_source == 'test_pattern':
-                    frame = self.create_test_pattern()
-                else:
-                    ret, frame = self.cap.read()
-                    if not ret:
-                        print("Cannot read frame. Restarting capture...")
-                        self.cap.release()
-                        self.setup_camera()
+                ret, frame = self.source.read()
+                if not ret:
+                    if self.source.seekable and self.source.seek(0):
                         continue
+                    print("Cannot read frame. Restarting capture...")
+                    self.source.release()
+                    self.setup_camera()
+                    continue
                 
                 # Mirror the frame (more natural)
-                frame = cv2.flip(frame, 1)
+                if self.source.mirror:
+                    frame = cv2.flip(frame, 1)
             
             # Create VR frame
             vr_frame = self.create_vr_frame(frame)
@@ -350,16 +292,55 @@ class SimpleVRConverter:
         if recording and video_writer:
             video_writer.release()
         
-        if self.cap and isinstance(self.camera_source, int):
-            self.cap.release()
+        if self.source:
+            self.source.release()
         
         cv2.destroyAllWindows()
         print("\nVR Converter stopped.")
+    
+    def benchmark(self, num_frames=300):
+        """
+        Run the stereo pipeline without any display and report throughput
+        
+        Seekable sources are rewound first so repeated runs process the
+        exact same frames.
+        """
+        if self.source.seekable:
+            self.source.seek(0)
+        
+        processed = 0
+        start = time.perf_counter()
+        for _ in range(num_frames):
+            ret, frame = self.source.read()
+            if not ret:
+                break
+            if self.source.mirror:
+                frame = cv2.flip(frame, 1)
+            self.create_vr_frame(frame)
+            processed += 1
+        elapsed = time.perf_counter() - start
+        
+        fps = processed / elapsed if elapsed > 0 else 0.0
+        print(f"Source: {self.source.name} | Frames: {processed} | "
+              f"Time: {elapsed:.3f}s | {fps:.1f} FPS | "
+              f"{1000.0 * elapsed / max(processed, 1):.2f} ms/frame")
+        return processed, elapsed
 
 # Main execution
 if __name__ == "__main__":
     import sys
     
+    # Headless benchmark: python vr.py --benchmark [source] [frames]
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        source = sys.argv[2] if len(sys.argv) > 2 else 'test_pattern'
+        if source.isdigit():
+            source = int(source)
+        frames = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+        vr_converter = SimpleVRConverter(camera_source=source, headless=True)
+        vr_converter.benchmark(frames)
+        vr_converter.source.release()
+        sys.exit(0)
+    
     print("="*50)
     print("SIMPLE VR CONVERTER")
     print("="*50)